@@ -11,25 +11,48 @@ Exit codes:
 - 0: Success, stdout added to context
 - 2: Blocking error (not used here)
 """
-import json
 import sys
 import os
-from pathlib import Path
 
 # Ensure Python 3
 if sys.version_info[0] < 3:
     sys.exit(0)
 
 
+def get_json_loads():
+    """Return a bytes -> object JSON decoder, preferring orjson if installed."""
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:
+        # json.loads accepts UTF-8 bytes directly; no separate decode pass
+        import json
+        return json.loads
+
+
 def deep_merge(base: dict, override: dict) -> dict:
-    """Deep merge two dictionaries. Override values take precedence."""
-    result = base.copy()
+    """
+    Deep merge override into base in place. Override values take precedence.
+
+    Both dicts come straight from json parsing and are owned by the caller,
+    so base is updated directly instead of being copied at every level.
+    """
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
+        current = base.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            deep_merge(current, value)
         else:
-            result[key] = value
-    return result
+            base[key] = value
+    return base
+
+
+def read_config(path: str):
+    """Return the raw bytes of a config file, or None if it cannot be read."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except IOError:
+        return None
 
 
 def load_settings():
@@ -40,28 +63,35 @@ def load_settings():
     Local settings override project settings.
     """
     project_dir = os.environ.get('CLAUDE_PROJECT_DIR', os.getcwd())
-    claude_dir = Path(project_dir) / '.claude'
+    claude_dir = os.path.join(project_dir, '.claude')
+
+    config_path = os.path.join(claude_dir, 'cck.json')
+    local_config_path = os.path.join(claude_dir, 'cck.local.json')
+
+    # Open directly rather than stat first: one syscall when present or absent
+    config_data = read_config(config_path)
+    local_config_data = read_config(local_config_path)
+    if config_data is None and local_config_data is None:
+        return None
 
-    config_path = claude_dir / 'cck.json'
-    local_config_path = claude_dir / 'cck.local.json'
+    # Deferred so the no-config path never pays for the import
+    loads = get_json_loads()
 
     settings = {}
 
     # Load base config (cck.json)
-    if config_path.exists():
+    if config_data is not None:
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-        except (json.JSONDecodeError, IOError):
+            settings = loads(config_data)
+        except ValueError:
             pass
 
     # Load local config (cck.local.json) and merge
-    if local_config_path.exists():
+    if local_config_data is not None:
         try:
-            with open(local_config_path, 'r', encoding='utf-8') as f:
-                local_settings = json.load(f)
-                settings = deep_merge(settings, local_settings)
-        except (json.JSONDecodeError, IOError):
+            local_settings = loads(local_config_data)
+            settings = deep_merge(settings, local_settings)
+        except ValueError:
             pass
 
     return settings if settings else None
@@ -69,8 +99,6 @@ def load_settings():
 
 def build_context(settings: dict) -> str:
     """Build context string from settings."""
-    lines = []
-
     language_map = {
         'vi': 'Vietnamese (Tiếng Việt)',
         'en': 'English',
@@ -96,33 +124,37 @@ def build_context(settings: dict) -> str:
     response_display = language_map.get(response_lang, response_lang)
     document_display = language_map.get(document_lang, document_lang)
 
-    lines.append("## CCK USER SETTINGS (MANDATORY)")
-    lines.append("")
-    lines.append("**Language Settings**:")
-    lines.append(f"- Think/Reasoning: {think_display}")
-    lines.append(f"- Response to user: {response_display}")
-    lines.append(f"- Documents (.reports, .plans, comments, commits): {document_display}")
-    lines.append("")
-
     # Workflow settings
+    workflow_block = ''
     workflow = settings.get('workflow', {})
     if workflow:
         max_instances = workflow.get('maxInstances', {})
         if max_instances:
-            lines.append("**Workflow**: Max agents per type:")
-            for agent, max_val in max_instances.items():
-                lines.append(f"  - {agent}: {max_val}")
-            lines.append("  - CRITICAL: Wait for ALL agents to complete before next phase")
-            lines.append("")
-
-    return '\n'.join(lines)
+            agent_lines = ''.join(
+                f"  - {agent}: {max_val}\n" for agent, max_val in max_instances.items()
+            )
+            workflow_block = (
+                "\n**Workflow**: Max agents per type:\n"
+                f"{agent_lines}"
+                "  - CRITICAL: Wait for ALL agents to complete before next phase\n"
+            )
+
+    return (
+        "## CCK USER SETTINGS (MANDATORY)\n"
+        "\n"
+        "**Language Settings**:\n"
+        f"- Think/Reasoning: {think_display}\n"
+        f"- Response to user: {response_display}\n"
+        f"- Documents (.reports, .plans, comments, commits): {document_display}\n"
+        f"{workflow_block}"
+    )
 
 
 def main():
-    # Read hook input from stdin
+    # Consume hook input from stdin (contents are not used, so skip decoding)
     try:
-        json.load(sys.stdin)
-    except (json.JSONDecodeError, IOError):
+        sys.stdin.buffer.read()
+    except (AttributeError, IOError):
         pass
 
     # Load settings
@@ -9,6 +9,9 @@ import re
 import yaml
 from pathlib import Path
 
+FRONTMATTER_RE = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+HYPHEN_CASE_RE = re.compile(r'^[a-z0-9-]+$')
+
 def validate_skill(skill_path):
     """Basic validation of a skill"""
     skill_path = Path(skill_path)
@@ -24,7 +27,7 @@ def validate_skill(skill_path):
         return False, "No YAML frontmatter found"
 
     # Extract frontmatter
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
+    match = FRONTMATTER_RE.match(content)
     if not match:
         return False, "Invalid frontmatter format"
 
@@ -62,7 +65,7 @@ def validate_skill(skill_path):
     name = name.strip()
     if name:
         # Check naming convention (hyphen-case: lowercase with hyphens)
-        if not re.match(r'^[a-z0-9-]+$', name):
+        if not HYPHEN_CASE_RE.match(name):
             return False, f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
         if name.startswith('-') or name.endswith('-') or '--' in name:
             return False, f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens"